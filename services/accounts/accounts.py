@@ -3,31 +3,93 @@
 from datetime import datetime, timezone
 from decimal import Decimal
 from math import ceil
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, HTTPException, Query, status
+from sqlalchemy import BigInteger, ColumnElement, cast, func
+from sqlalchemy.orm import InstrumentedAttribute, Session, selectinload
 
 from dependencies import AuthenticatedUser, DBSession
 from models import Account, AccountBalanceHistory, BalanceSource, BalanceType 
 from models import AccountStatus as AccountStatusModel
 from models import TransactionType as TransactionTypeModel
 from schemas import (
+    HISTORY_LIST_ADAPTER,
     AccountBalanceSummary,
     AccountCreate,
     AccountIdentifier,
     AccountResponse,
     AccountStatus,
-    AccountSummary,
+    AccountSummaryTD,
     AccountType,
     AccountUpdate,
     MessageResponse,
     NetWorthSummary,
+    PaginatedAccountBalanceHistoryFast,
     PaginatedAccounts,
+    PaginatedAccountsColumnar,
+    PaginatedResponse,
 )
 
 router = APIRouter(prefix="/api/v1/accounts", tags=["Accounts"])
 
+
+def _account_summary(account: Account) -> AccountSummaryTD:
+    """Build a list-view summary row from an Account."""
+    return {
+        "id": account.id,
+        "name": account.name,
+        "account_type": account.account_type,
+        "institution": account.institution,
+        "currency": account.currency,
+        "balance": account.balance,
+        "status": account.status,
+    }
+
+
+# PaginatedAccountsColumnar list fields, in the order _to_columnar builds rows
+_COLUMNAR_FIELDS = tuple(
+    name
+    for name in PaginatedAccountsColumnar.model_fields
+    if name not in PaginatedResponse.model_fields
+)
+
+
+def _to_columnar(accounts: list[Account], **page_info: int) -> PaginatedAccountsColumnar:
+    """Transpose Account rows into a columnar paginated response."""
+    rows = [
+        (
+            acc.id,
+            acc.name,
+            acc.account_type,
+            acc.institution,
+            acc.currency,
+            acc.balance,
+            acc.status,
+        )
+        for acc in accounts
+    ]
+    columns = [list(col) for col in zip(*rows, strict=True)] or [[] for _ in _COLUMNAR_FIELDS]
+    return PaginatedAccountsColumnar(
+        **dict(zip(_COLUMNAR_FIELDS, columns, strict=True)),
+        **page_info,
+    )
+
+
+def _build_account(account_data: AccountCreate, user_id: str) -> Account:
+    """Build a new active Account for a user from creation data."""
+    return Account(
+        user_id=user_id,
+        name=account_data.name,
+        account_type=account_data.account_type.value,
+        institution_name=account_data.institution,
+        mask=account_data.account_number_masked,
+        currency=account_data.currency,
+        notes=account_data.notes,
+        status=AccountStatusModel.ACTIVE.value,
+    )
+
+
 # --- Account Endpoints ---
 
 
@@ -48,16 +110,7 @@ def create_account(
     Returns:
         AccountResponse: Created account data
     """
-    account = Account(
-        user_id=current_user.id,
-        name=account_data.name,
-        account_type=account_data.account_type.value,
-        institution_name=account_data.institution,
-        mask=account_data.account_number_masked,
-        currency=account_data.currency,
-        notes=account_data.notes,
-        status=AccountStatusModel.ACTIVE.value,
-    )
+    account = _build_account(account_data, current_user.id)
     
     db.add(account)
     db.commit()
@@ -79,30 +132,72 @@ def create_account(
     return account
 
 
-@router.get("", response_model=PaginatedAccounts)
-def list_accounts(
+@router.post(
+    "/bulk",
+    response_model=list[AccountResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def create_accounts_bulk(
+    accounts_data: Annotated[list[AccountCreate], Body(min_length=1, max_length=100)],
     db: DBSession,
     current_user: AuthenticatedUser,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    account_type: AccountType | None = None,
-    status: AccountStatus | None = None,
-) -> PaginatedAccounts:
+) -> list[Account]:
     """
-    List all accounts for the current user.
+    Create multiple financial accounts in a single transaction.
 
     Args:
+        accounts_data: List of account creation data
         db: Database session
         current_user: Current authenticated user
-        page: Page number (1-indexed)
-        page_size: Number of items per page
-        account_type: Filter by account type
-        status: Filter by account status
 
     Returns:
-        PaginatedAccounts: Paginated list of accounts
+        list[AccountResponse]: Created accounts, in request order
     """
-    query = db.query(Account).filter(Account.user_id == current_user.id)
+    valid_from = datetime.now(timezone.utc)
+    accounts = []
+    for account_data in accounts_data:
+        account = _build_account(account_data, current_user.id)
+        account.balance_history.append(
+            AccountBalanceHistory(
+                balance=account_data.balance,
+                balance_type=BalanceType.CURRENT.value,
+                valid_from=valid_from,
+                is_current=True,
+                source=BalanceSource.MANUAL_CORRECTION.value,
+            )
+        )
+        accounts.append(account)
+
+    db.add_all(accounts)
+    db.flush()
+    account_ids = [account.id for account in accounts]
+    db.commit()
+
+    # Reload with balance history in one extra query instead of one per account
+    loaded = {
+        account.id: account
+        for account in db.query(Account)
+        .options(selectinload(Account.balance_history))
+        .filter(Account.id.in_(account_ids))
+    }
+    return [loaded[account_id] for account_id in account_ids]
+
+
+def _query_accounts_page(
+    db: Session,
+    user_id: str,
+    page: int,
+    page_size: int,
+    account_type: AccountType | None,
+    status: AccountStatus | None,
+) -> tuple[list[Account], dict[str, int]]:
+    """
+    Load one page of a user's accounts, newest first.
+
+    Returns:
+        tuple: The accounts on the page and the pagination fields
+    """
+    query = db.query(Account).filter(Account.user_id == user_id)
 
     if account_type:
         query = query.filter(Account.account_type == account_type.value)
@@ -118,16 +213,79 @@ def list_accounts(
         .limit(page_size)
         .all()
     )
+    page_info = {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+    }
+    return accounts, page_info
+
+
+@router.get("", response_model=PaginatedAccounts)
+def list_accounts(
+    db: DBSession,
+    current_user: AuthenticatedUser,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    account_type: AccountType | None = None,
+    status: AccountStatus | None = None,
+) -> PaginatedAccounts:
+    """
+    List all accounts for the current user.
+
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+        page: Page number (1-indexed)
+        page_size: Number of items per page
+        account_type: Filter by account type
+        status: Filter by account status
 
+    Returns:
+        PaginatedAccounts: Paginated list of accounts
+    """
+    accounts, page_info = _query_accounts_page(
+        db, current_user.id, page, page_size, account_type, status
+    )
     return PaginatedAccounts(
-        items=[AccountSummary.model_validate(acc) for acc in accounts],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+        items=[_account_summary(acc) for acc in accounts],
+        **page_info,
     )
 
 
+@router.get("/columns", response_model=PaginatedAccountsColumnar)
+def list_accounts_columnar(
+    db: DBSession,
+    current_user: AuthenticatedUser,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    account_type: AccountType | None = None,
+    status: AccountStatus | None = None,
+) -> PaginatedAccountsColumnar:
+    """
+    List all accounts for the current user with one list per field.
+
+    Same filters and paging as the list endpoint, without repeating field
+    names on every row.
+
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+        page: Page number (1-indexed)
+        page_size: Number of items per page
+        account_type: Filter by account type
+        status: Filter by account status
+
+    Returns:
+        PaginatedAccountsColumnar: Paginated accounts in columnar layout
+    """
+    accounts, page_info = _query_accounts_page(
+        db, current_user.id, page, page_size, account_type, status
+    )
+    return _to_columnar(accounts, **page_info)
+
+
 @router.get("/summary", response_model=NetWorthSummary)
 def get_net_worth_summary(
     db: DBSession,
@@ -370,4 +528,78 @@ def delete_account(
     account.status = AccountStatusModel.CLOSED.value
     db.commit()
 
-    return MessageResponse(message="Account closed successfully")
\ No newline at end of file
+    return MessageResponse(message="Account closed successfully")
+
+
+# --- Balance History Endpoints ---
+
+
+def _epoch_seconds(column: InstrumentedAttribute[datetime]) -> ColumnElement[int]:
+    """Build a SQL expression converting a timestamp column to unix seconds."""
+    return cast(func.floor(func.extract("epoch", column)), BigInteger)
+
+
+@router.get("/{account_id}/balance-history", response_model=PaginatedAccountBalanceHistoryFast)
+def list_balance_history(
+    account_id: str,
+    db: DBSession,
+    current_user: AuthenticatedUser,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+) -> PaginatedAccountBalanceHistoryFast:
+    """
+    List balance history snapshots for an account, newest first.
+
+    Validity bounds are returned as unix timestamps (seconds) and are computed
+    by the database, so rows are validated as plain integers.
+
+    Args:
+        account_id: Account ID
+        db: Database session
+        current_user: Current authenticated user
+        page: Page number (1-indexed)
+        page_size: Number of items per page
+
+    Returns:
+        PaginatedAccountBalanceHistoryFast: Paginated list of balance snapshots
+    """
+    account = (
+        db.query(Account.id)
+        .filter(Account.id == account_id, Account.user_id == current_user.id)
+        .first()
+    )
+
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Account not found",
+        )
+
+    query = db.query(
+        AccountBalanceHistory.id,
+        AccountBalanceHistory.account_id,
+        AccountBalanceHistory.balance,
+        AccountBalanceHistory.balance_type,
+        _epoch_seconds(AccountBalanceHistory.valid_from).label("valid_from"),
+        _epoch_seconds(AccountBalanceHistory.valid_to).label("valid_to"),
+        AccountBalanceHistory.is_current,
+        AccountBalanceHistory.source,
+    ).filter(AccountBalanceHistory.account_id == account_id)
+
+    total = query.count()
+    total_pages = ceil(total / page_size) if total > 0 else 1
+
+    rows = (
+        query.order_by(AccountBalanceHistory.valid_from.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+
+    return PaginatedAccountBalanceHistoryFast(
+        items=HISTORY_LIST_ADAPTER.validate_python(rows, from_attributes=True),
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+    )
@@ -1,6 +1,6 @@
 """Configuration management for Accounts Service using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cache, cached_property
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,6 +21,10 @@ class Settings(BaseSettings):
     accounts_db_name: str = "accounts_db"
     accounts_db_host: str = "localhost"
     accounts_db_port: int = 5433
+    # Run create_all at startup; off by default since Alembic owns the schema
+    accounts_create_tables: bool = False
+    # Connections opened at startup so early requests skip connection setup
+    accounts_db_pool_warm_connections: int = 2
 
     # JWT Configuration (for validating tokens from auth service)
     auth_jwt_secret_key: str = "your-super-secret-key-change-in-production"
@@ -30,7 +34,7 @@ class Settings(BaseSettings):
     app_name: str = "FlowForward Accounts Service"
     debug: bool = False
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Construct the database URL from individual components."""
         return (
@@ -38,7 +42,12 @@ class Settings(BaseSettings):
             f"@{self.accounts_db_host}:{self.accounts_db_port}/{self.accounts_db_name}"
         )
 
-    @property
+    @cached_property
+    def auth_jwt_algorithms(self) -> tuple[str, ...]:
+        """Algorithms accepted when verifying JWTs."""
+        return (self.auth_jwt_algorithm,)
+
+    @cached_property
     def async_database_url(self) -> str:
         """Construct the async database URL for async SQLAlchemy."""
         return (
@@ -47,7 +56,7 @@ class Settings(BaseSettings):
         )
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
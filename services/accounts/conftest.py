@@ -31,9 +31,9 @@ for key, value in _test_env_defaults.items():
     if key not in os.environ:
         os.environ[key] = value
 
+import jwt
 import pytest
 from fastapi.testclient import TestClient
-from jose import jwt
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -42,8 +42,17 @@ _service_dir = Path(__file__).parent
 
 
 def _import_module(name: str, module_file: str):
-    """Import a module from the service directory by file path."""
+    """
+    Import a module from the service directory by file path.
+
+    Returns the already-loaded module if one with the same name was loaded
+    from the same file, so repeat imports don't re-run model definitions.
+    """
     module_path = _service_dir / module_file
+    existing = sys.modules.get(name)
+    if existing is not None and getattr(existing, "__file__", None) == str(module_path):
+        return existing
+
     spec = importlib.util.spec_from_file_location(name, module_path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[name] = module
@@ -89,8 +98,8 @@ def get_test_settings() -> TestSettings:
     return TestSettings()
 
 
-# Test schema name
-TEST_SCHEMA = "test_accounts"
+# Test schema name, one per pytest-xdist worker so parallel runs don't collide
+TEST_SCHEMA = f"test_accounts_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
 
 @pytest.fixture(scope="session")
@@ -108,50 +117,23 @@ def test_engine(test_settings: TestSettings):
     """
     engine = create_engine(
         test_settings.database_url,
-        pool_pre_ping=True,
         echo=False,
+        connect_args={"options": f"-c search_path={TEST_SCHEMA}"},
     )
 
-    # Create the test schema if it doesn't exist
-    with engine.connect() as conn:
+    # Start from an empty test schema
+    with engine.begin() as conn:
         conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
         conn.execute(text(f"CREATE SCHEMA {TEST_SCHEMA}"))
-        conn.commit()
-
-    # Set the search path to use the test schema
-    @pytest.fixture(autouse=True)
-    def set_schema():
-        with engine.connect() as conn:
-            conn.execute(text(f"SET search_path TO {TEST_SCHEMA}"))
-            conn.commit()
-
-    # Create all tables in the test schema
-    with engine.connect() as conn:
-        conn.execute(text(f"SET search_path TO {TEST_SCHEMA}"))
-        conn.commit()
-
-    # Update engine to use test schema by default
-    engine = create_engine(
-        test_settings.database_url,
-        pool_pre_ping=True,
-        echo=False,
-        connect_args={"options": f"-c search_path={TEST_SCHEMA}"},
-    )
-
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+        # Schema is brand new, so skip per-table existence probes
+        Base.metadata.create_all(bind=conn, checkfirst=False)
 
     yield engine
 
     # Cleanup: Drop the test schema after all tests
-    cleanup_engine = create_engine(
-        test_settings.database_url,
-        pool_pre_ping=True,
-    )
-    with cleanup_engine.connect() as conn:
+    with engine.begin() as conn:
         conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
-        conn.commit()
-    cleanup_engine.dispose()
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -181,8 +163,23 @@ def db_session(test_engine) -> Generator[Session, Any, None]:
         connection.close()
 
 
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, Any, None]:
+    """
+    Provide a FastAPI test client shared across the test session.
+
+    The app lifespan runs once per session instead of once per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture(scope="function")
-def client(db_session: Session, test_settings: TestSettings) -> Generator[TestClient, Any, None]:
+def client(
+    app_client: TestClient,
+    db_session: Session,
+    test_settings: TestSettings,
+) -> Generator[TestClient, Any, None]:
     """
     Provide a FastAPI test client with overridden dependencies.
 
@@ -199,8 +196,7 @@ def client(db_session: Session, test_settings: TestSettings) -> Generator[TestCl
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_settings] = override_get_settings
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
 
     # Clear overrides after test
     app.dependency_overrides.clear()
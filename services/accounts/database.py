@@ -19,7 +19,10 @@ settings = get_settings()
 
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    # Recycle connections before server/LB idle timeouts instead of paying a
+    # SELECT 1 round-trip on every checkout
+    pool_pre_ping=False,
+    pool_recycle=1800,
     pool_size=10,
     max_overflow=20,
     echo=settings.debug,
@@ -32,6 +35,17 @@ SessionLocal = sessionmaker(
 )
 
 
+def warm_pool(connections: int) -> None:
+    """Open connections up front so they sit in the pool for early requests."""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for conn in opened:
+            conn.close()
+
+
 def get_db() -> Generator[Session, Any, None]:
     """
     Dependency that provides a database session.
@@ -46,6 +60,7 @@ def get_db() -> Generator[Session, Any, None]:
 
 
 def create_tables() -> None:
-    """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Create all database tables in a single transaction."""
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
 
@@ -1,31 +1,31 @@
 """FastAPI dependencies for Accounts Service."""
 
+import logging
+from dataclasses import dataclass
 from typing import Annotated
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from config import Settings, get_settings
 from database import get_db
 
+logger = logging.getLogger(__name__)
+
 # Use HTTPBearer for simple Bearer token input in Swagger UI
 bearer_scheme = HTTPBearer(
     scheme_name="Bearer Token",
     description="Enter your JWT access token from the auth service",
 )
 
+# jwt.decode options, built once rather than per request
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
 
-class TokenPayload(BaseModel):
-    """Schema for JWT token payload."""
-
-    sub: str  # User ID
-    type: str  # "access" or "refresh"
 
-
-class CurrentUser(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
     """Represents the current authenticated user."""
 
     id: str
@@ -61,14 +61,12 @@ def get_current_user(
         payload = jwt.decode(
             credentials.credentials,
             settings.auth_jwt_secret_key,
-            algorithms=[settings.auth_jwt_algorithm],
+            algorithms=settings.auth_jwt_algorithms,
+            options=_JWT_DECODE_OPTIONS,
         )
-        user_id: str | None = payload.get("sub")
+        user_id: str = payload["sub"]
         token_type: str | None = payload.get("type")
 
-        if user_id is None:
-            raise credentials_exception
-
         if token_type != "access":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -76,10 +74,8 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    except JWTError as e:
-        # Log for debugging - remove in production
-        print(f"JWT decode error: {e}")
-        print(f"Secret key (first 10 chars): {settings.auth_jwt_secret_key[:10]}...")
+    except jwt.InvalidTokenError as e:
+        logger.debug("JWT decode error: %s", e)
         raise credentials_exception
 
     return CurrentUser(id=user_id)
@@ -1,17 +1,23 @@
 """FastAPI application entry point for Accounts Service."""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import OperationalError
 
 from accounts import router as accounts_router
 # from accounts import transaction_router
 from config import get_settings
-from database import create_tables
+from database import create_tables, warm_pool
 from schemas import HealthResponse
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
 
@@ -23,7 +29,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events.
     """
     # Startup
-    create_tables()
+    if settings.debug or settings.accounts_create_tables:
+        # DDL round-trips run in a worker thread, off the event loop
+        await asyncio.to_thread(create_tables)
+
+    if settings.accounts_db_pool_warm_connections > 0:
+        try:
+            await asyncio.to_thread(warm_pool, settings.accounts_db_pool_warm_connections)
+        except OperationalError:
+            logger.warning("Could not pre-connect the database pool", exc_info=True)
+
+    # Resolve every route's dependencies and schemas now (cached on the app)
+    # rather than on the first request or /docs hit after a deploy
+    app.openapi()
     yield
     # Shutdown
     pass
@@ -44,8 +62,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Include routers
@@ -53,28 +72,37 @@ app.include_router(accounts_router)
 # app.include_router(transaction_router)
 
 
-@app.get("/health", response_model=HealthResponse, tags=["Health"])
-def health_check() -> HealthResponse:
+# Constant payloads for probe-heavy endpoints, serialized once at import
+_HEALTH_BODY = orjson.dumps(
+    HealthResponse(
+        status="healthy",
+        service="accounts-service",
+        version="0.1.0",
+    ).model_dump()
+)
+_ROOT_BODY = orjson.dumps(
+    {
+        "service": "FlowForward Accounts Service",
+        "version": "0.1.0",
+        "docs": "/docs",
+    }
+)
+
+
+@app.get("/health", responses={200: {"model": HealthResponse}}, tags=["Health"])
+def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns service health status.
     """
-    return HealthResponse(
-        status="healthy",
-        service="accounts-service",
-        version="0.1.0",
-    )
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
-def root() -> dict[str, str]:
+def root() -> Response:
     """Root endpoint."""
-    return {
-        "service": "FlowForward Accounts Service",
-        "version": "0.1.0",
-        "docs": "/docs",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
 """Pydantic schemas for Accounts Service request/response validation."""
 
-import re
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Union
+from typing import TypedDict, Union
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic_core import core_schema
 
 
 # --- Enums ---
@@ -61,7 +61,25 @@ class BalanceSource(str, Enum):
 
 # --- Account Identifier (UUID or Mask) ---
 
-MASK_PATTERN = re.compile(r"^\d{4}$")
+MASK_LENGTH = 4
+
+
+def _parse_aid(v) -> tuple[str, bool]:
+    """Parse a raw account identifier string into (value, is_mask)."""
+    if not isinstance(v, str):
+        raise ValueError("Account identifier must be a string")
+
+    # Check for 4-digit mask (same digit set as the \d regex class)
+    if len(v) == MASK_LENGTH and v.isdecimal():
+        return v, True
+
+    # Validate as UUID
+    try:
+        return str(UUID(v)), False
+    except ValueError:
+        raise ValueError(
+            "Account identifier must be a valid UUID or 4-digit account mask"
+        ) from None
 
 
 class AccountIdentifier:
@@ -85,34 +103,24 @@ class AccountIdentifier:
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type, handler):
         """Pydantic v2 schema definition for path parameter support."""
-        from pydantic_core import core_schema
-
         return core_schema.no_info_plain_validator_function(
             cls.validate,
             serialization=core_schema.to_string_ser_schema(),
         )
 
+    @classmethod
+    def __get_pydantic_json_schema__(cls, _core_schema, handler):
+        """OpenAPI schema: a plain string (UUID or 4-digit mask)."""
+        return {"type": "string", "examples": ["1234"]}
+
     @classmethod
     def validate(cls, v) -> "AccountIdentifier":
         """Validate and parse string into AccountIdentifier."""
         if isinstance(v, cls):
             return v
 
-        if not isinstance(v, str):
-            raise ValueError("Account identifier must be a string")
-
-        # Check for 4-digit mask pattern
-        if MASK_PATTERN.match(v):
-            return cls(value=v, is_mask=True)
-
-        # Validate as UUID
-        try:
-            uuid_obj = UUID(v)
-            return cls(value=str(uuid_obj), is_mask=False)
-        except ValueError:
-            raise ValueError(
-                "Account identifier must be a valid UUID or 4-digit account mask"
-            )
+        value, is_mask = _parse_aid(v)
+        return cls(value=value, is_mask=is_mask)
 
     def __str__(self) -> str:
         return self.value
@@ -156,11 +164,23 @@ class AccountUpdate(BaseModel):
     notes: str | None = None
 
 
-class AccountResponse(AccountBase):
-    """Schema for account response."""
+class AccountResponse(BaseModel):
+    """
+    Schema for account response.
+
+    Declares its fields directly rather than subclassing AccountBase, so the
+    response schema is built without walking the base-class hierarchy.
+    """
 
     model_config = ConfigDict(from_attributes=True)
 
+    name: str = Field(..., min_length=1, max_length=255)
+    account_type: AccountType = AccountType.CHECKING
+    institution: str | None = Field(None, max_length=255)
+    account_number_masked: str | None = Field(None, max_length=50)
+    currency: str = Field("USD", min_length=3, max_length=3)
+    credit_limit: Decimal | None = None
+    notes: str | None = None
     id: str
     user_id: str
     balance: Decimal
@@ -184,6 +204,23 @@ class AccountSummary(BaseModel):
     status: AccountStatus
 
 
+class AccountSummaryTD(TypedDict):
+    """
+    Typed dict for account summary (list view).
+
+    Used for paginated list items so rows are validated into plain dicts
+    instead of constructing one model instance per account.
+    """
+
+    id: str
+    name: str
+    account_type: AccountType
+    institution: str | None
+    currency: str
+    balance: Decimal
+    status: AccountStatus
+
+
 # --- Account Balance History Schemas (SCD Type 2) ---
 
 
@@ -248,11 +285,50 @@ class AccountBalanceHistoryUpdate(BaseModel):
     metadata: dict | None = None
 
 
-class AccountBalanceHistoryResponse(AccountBalanceHistoryBase):
-    """Schema for account balance history response."""
+class AccountBalanceHistoryResponse(BaseModel):
+    """
+    Schema for account balance history response.
+
+    Declares its fields directly rather than subclassing
+    AccountBalanceHistoryBase, like AccountResponse.
+    """
 
     model_config = ConfigDict(from_attributes=True)
 
+    balance: Decimal = Field(
+        ...,
+        max_digits=15,
+        decimal_places=2,
+        description="Balance value from Plaid at this point in time",
+    )
+    balance_type: BalanceType = Field(
+        ...,
+        description="Type of balance: 'available' for checking/savings, 'current' for credit/loans",
+    )
+    valid_from: datetime = Field(
+        ...,
+        description="Timestamp when this balance became effective",
+    )
+    valid_to: datetime | None = Field(
+        None,
+        description="Timestamp when this balance was superseded (NULL if current)",
+    )
+    is_current: bool = Field(
+        True,
+        description="Whether this is the current active snapshot (only one per account)",
+    )
+    source: BalanceSource = Field(
+        BalanceSource.PLAID_SYNC,
+        description="Origin of this balance snapshot",
+    )
+    plaid_last_updated: datetime | None = Field(
+        None,
+        description="Timestamp from Plaid indicating when balance was last updated at institution",
+    )
+    metadata: dict = Field(
+        default_factory=dict,
+        description="Audit trail and sync details (original_balance, sync_datetime, etc.)",
+    )
     id: str
     account_id: str
     created_at: datetime = Field(
@@ -276,6 +352,44 @@ class AccountBalanceHistorySummary(BaseModel):
     source: BalanceSource
 
 
+class AccountBalanceHistorySummaryFast(BaseModel):
+    """
+    Schema for account balance history summary with epoch timestamps.
+
+    Validity bounds are unix seconds instead of ISO-8601 datetimes, so large
+    balance-history pages validate and serialize as plain integers.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    account_id: str
+    balance: Decimal
+    balance_type: BalanceType
+    valid_from: int = Field(
+        ...,
+        description="Unix timestamp (seconds) when this balance became effective",
+    )
+    valid_to: int | None = Field(
+        None,
+        description="Unix timestamp (seconds) when this balance was superseded (NULL if current)",
+    )
+    is_current: bool
+    source: BalanceSource
+
+    @property
+    def valid_from_datetime(self) -> datetime:
+        """Get valid_from as a timezone-aware datetime."""
+        return datetime.fromtimestamp(self.valid_from, tz=timezone.utc)
+
+    @property
+    def valid_to_datetime(self) -> datetime | None:
+        """Get valid_to as a timezone-aware datetime (None if current)."""
+        if self.valid_to is None:
+            return None
+        return datetime.fromtimestamp(self.valid_to, tz=timezone.utc)
+
+
 # --- Aggregate Schemas ---
 
 
@@ -336,7 +450,24 @@ class PaginatedResponse(BaseModel):
 class PaginatedAccounts(PaginatedResponse):
     """Paginated accounts response."""
 
-    items: list[AccountSummary]
+    items: list[AccountSummaryTD]
+
+
+class PaginatedAccountsColumnar(PaginatedResponse):
+    """
+    Paginated accounts response in columnar layout.
+
+    Each summary field is one list, aligned by index, so field names are
+    not repeated per row.
+    """
+
+    ids: list[str]
+    names: list[str]
+    account_types: list[AccountType]
+    institutions: list[str | None]
+    currencies: list[str]
+    balances: list[Decimal]
+    statuses: list[AccountStatus]
 
 
 # class PaginatedTransactions(PaginatedResponse):
@@ -350,3 +481,14 @@ class PaginatedAccountBalanceHistory(PaginatedResponse):
 
     items: list[AccountBalanceHistorySummary]
 
+
+class PaginatedAccountBalanceHistoryFast(PaginatedResponse):
+    """Paginated account balance history response with epoch timestamps."""
+
+    items: list[AccountBalanceHistorySummaryFast]
+
+
+# --- Type Adapters ---
+
+# Validates a whole page of balance-history rows in a single call
+HISTORY_LIST_ADAPTER = TypeAdapter(list[AccountBalanceHistorySummaryFast])
@@ -62,14 +62,38 @@ class TestCreateAccount:
             "other",
         ]
 
-        for acc_type in account_types:
-            response = client.post(
-                "/api/v1/accounts",
-                json={"name": f"Test {acc_type}", "account_type": acc_type},
-                headers=auth_headers,
-            )
-            assert response.status_code == 201
-            assert response.json()["account_type"] == acc_type
+        response = client.post(
+            "/api/v1/accounts/bulk",
+            json=[
+                {"name": f"Test {acc_type}", "account_type": acc_type}
+                for acc_type in account_types
+            ],
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert len(data) == len(account_types)
+        assert [acc["account_type"] for acc in data] == account_types
+
+    def test_create_accounts_bulk_empty(self, client, auth_headers):
+        """Test bulk creation rejects an empty list."""
+        response = client.post("/api/v1/accounts/bulk", json=[], headers=auth_headers)
+
+        assert response.status_code == 422
+
+    def test_create_accounts_bulk_too_many(self, client, auth_headers):
+        """Test bulk creation rejects more than 100 accounts."""
+        response = client.post(
+            "/api/v1/accounts/bulk",
+            json=[{"name": f"Account {i}"} for i in range(101)],
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
+        response = client.get("/api/v1/accounts", headers=auth_headers)
+        assert response.json()["total"] == 0
 
 
 class TestListAccounts:
@@ -134,6 +158,21 @@ class TestListAccounts:
         assert data["page"] == 1
         assert data["total_pages"] == 3
 
+    def test_list_accounts_columnar_format(self, client, auth_headers, create_account):
+        """Test listing accounts in columnar format."""
+        create_account(name="Checking", account_type="checking")
+        create_account(name="Savings", account_type="savings")
+
+        response = client.get("/api/v1/accounts/columns", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "items" not in data
+        assert data["total"] == 2
+        assert len(data["ids"]) == 2
+        assert sorted(data["names"]) == ["Checking", "Savings"]
+        assert sorted(data["account_types"]) == ["checking", "savings"]
+
 
 class TestGetAccount:
     """Tests for getting a single account."""
@@ -382,3 +421,41 @@ class TestBalancesByType:
         assert Decimal(checking["total_balance"]) == Decimal("3000.00")
         assert checking["accounts_count"] == 2
 
+
+class TestBalanceHistory:
+    """Tests for the balance history endpoint."""
+
+    def test_balance_history_after_update(self, client, auth_headers, create_account):
+        """Test balance history returns epoch-second snapshots, newest first."""
+        account = create_account(balance="1000.00")
+        client.patch(
+            f"/api/v1/accounts/{account['id']}",
+            json={"balance": "2500.00"},
+            headers=auth_headers,
+        )
+
+        response = client.get(
+            f"/api/v1/accounts/{account['id']}/balance-history",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        current, previous = data["items"]
+        assert Decimal(current["balance"]) == Decimal("2500.00")
+        assert current["is_current"] is True
+        assert current["valid_to"] is None
+        assert isinstance(current["valid_from"], int)
+        assert Decimal(previous["balance"]) == Decimal("1000.00")
+        assert previous["is_current"] is False
+        assert isinstance(previous["valid_to"], int)
+
+    def test_balance_history_account_not_found(self, client, auth_headers):
+        """Test balance history for a non-existent account."""
+        response = client.get(
+            "/api/v1/accounts/non-existent-id/balance-history",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
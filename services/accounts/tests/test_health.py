@@ -22,3 +22,10 @@ def test_root_endpoint(client):
     assert data["version"] == "0.1.0"
     assert data["docs"] == "/docs"
 
+
+def test_openapi_schema(client):
+    """Test the OpenAPI schema is generated for every route."""
+    response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    assert "/api/v1/accounts/{account_id_or_mask}" in response.json()["paths"]
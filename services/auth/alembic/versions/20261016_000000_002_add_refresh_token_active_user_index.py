@@ -0,0 +1,33 @@
+"""Add partial index on active refresh tokens per user
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create partial index for unrevoked refresh tokens."""
+    # Used by logout/all, which only touches unrevoked tokens for a user
+    op.create_index(
+        "ix_refresh_tokens_user_active",
+        "refresh_tokens",
+        ["user_id"],
+        postgresql_where=sa.text("is_revoked = false"),
+    )
+
+
+def downgrade() -> None:
+    """Drop partial index for unrevoked refresh tokens."""
+    op.drop_index("ix_refresh_tokens_user_active", table_name="refresh_tokens")
@@ -0,0 +1,57 @@
+"""Store SHA-256 hash of refresh tokens instead of the token text
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 00:00:01.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace refresh_tokens.token with a 32-byte token_hash column."""
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token_hash", sa.LargeBinary(32), nullable=True),
+    )
+
+    # Backfill existing rows so issued tokens keep working
+    op.execute(
+        "UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))"
+    )
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+
+    op.create_index(
+        "ix_refresh_tokens_token_hash",
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+    )
+
+    # Dropping the column also drops its unique constraint and index
+    op.drop_column("refresh_tokens", "token")
+
+
+def downgrade() -> None:
+    """Restore refresh_tokens.token text column.
+
+    Token text cannot be recovered from its hash, so existing refresh
+    tokens are deleted and users must log in again.
+    """
+    op.execute("DELETE FROM refresh_tokens")
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "token_hash")
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token", sa.Text(), unique=True, nullable=False),
+    )
+    op.create_index("ix_refresh_tokens_token", "refresh_tokens", ["token"])
@@ -0,0 +1,59 @@
+"""Make user email and username case-insensitive with citext
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import CITEXT
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert users.email and users.username to CITEXT.
+
+    Fails if existing rows differ only by case, since the unique indexes
+    are rebuilt with case-insensitive comparison.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext SCHEMA public")
+    op.alter_column(
+        "users",
+        "email",
+        type_=CITEXT(),
+        existing_type=sa.String(255),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "users",
+        "username",
+        type_=CITEXT(),
+        existing_type=sa.String(100),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Convert users.email and users.username back to VARCHAR."""
+    op.alter_column(
+        "users",
+        "username",
+        type_=sa.String(100),
+        existing_type=CITEXT(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "users",
+        "email",
+        type_=sa.String(255),
+        existing_type=CITEXT(),
+        existing_nullable=False,
+    )
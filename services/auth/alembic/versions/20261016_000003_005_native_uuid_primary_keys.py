@@ -0,0 +1,72 @@
+"""Store user and refresh token ids as native UUIDs
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs stored as String(36) by revision 001
+ID_COLUMNS = (
+    ("users", "id"),
+    ("refresh_tokens", "id"),
+    ("refresh_tokens", "user_id"),
+)
+
+
+def upgrade() -> None:
+    """Convert id and user_id columns from VARCHAR(36) to UUID."""
+    op.drop_constraint(
+        "refresh_tokens_user_id_fkey", "refresh_tokens", type_="foreignkey"
+    )
+    for table, column in ID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Uuid(),
+            existing_type=sa.String(36),
+            existing_nullable=False,
+            postgresql_using=f"{column}::uuid",
+        )
+    op.create_foreign_key(
+        "refresh_tokens_user_id_fkey",
+        "refresh_tokens",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Convert id and user_id columns back to VARCHAR(36)."""
+    op.drop_constraint(
+        "refresh_tokens_user_id_fkey", "refresh_tokens", type_="foreignkey"
+    )
+    for table, column in ID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(36),
+            existing_type=sa.Uuid(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+    op.create_foreign_key(
+        "refresh_tokens_user_id_fkey",
+        "refresh_tokens",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,40 @@
+"""Add indexes backing the refresh token purge
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create indexes on refresh token expiry and revoked creation time."""
+    # purge_expired_refresh_tokens deletes expired tokens and revoked tokens
+    # past retention; without these each batch scans the whole table
+    op.create_index(
+        "ix_refresh_tokens_expires_at",
+        "refresh_tokens",
+        ["expires_at"],
+    )
+    op.create_index(
+        "ix_refresh_tokens_revoked_created_at",
+        "refresh_tokens",
+        ["created_at"],
+        postgresql_where=sa.text("is_revoked = true"),
+    )
+
+
+def downgrade() -> None:
+    """Drop refresh token purge indexes."""
+    op.drop_index("ix_refresh_tokens_revoked_created_at", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
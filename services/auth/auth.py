@@ -1,17 +1,23 @@
 """Authentication routes and JWT logic for Auth Service."""
 
+import hashlib
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
 
 from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID, uuid4
+
+import bcrypt
+import jwt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload
 
-from config import Settings
+from config import Settings, get_settings
 from dependencies import AppSettings, CurrentUser, DBSession
 from models import RefreshToken, User
 from schemas import (
@@ -25,39 +31,79 @@ from schemas import (
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hasher: argon2id for new hashes. Legacy bcrypt hashes still
+# verify and are upgraded on the next successful login, as are argon2 hashes
+# made with different cost parameters.
+_hash_settings = get_settings()
+password_hasher = PasswordHasher(
+    time_cost=_hash_settings.auth_argon2_time_cost,
+    memory_cost=_hash_settings.auth_argon2_memory_cost_kib,
+    parallelism=_hash_settings.auth_argon2_parallelism,
+)
+
+# Prefix shared by all bcrypt hash variants ($2a$, $2b$, $2y$)
+_BCRYPT_PREFIX = "$2"
+
+# Verified against when the user does not exist, so unknown usernames take
+# as long as wrong passwords
+_DUMMY_HASH = password_hasher.hash("dummy-password-for-timing")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a plain password against an argon2id or legacy bcrypt hash."""
+    if hashed_password.startswith(_BCRYPT_PREFIX):
+        # Legacy hashes were made from the first 72 bytes (bcrypt's limit);
+        # bcrypt 5 raises instead of truncating, so truncate here
+        try:
+            return bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+        except ValueError:
+            return False
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check if a hash is legacy bcrypt or uses outdated argon2 parameters."""
+    if hashed_password.startswith(_BCRYPT_PREFIX):
+        return True
+    return password_hasher.check_needs_rehash(hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a password using argon2id."""
+    return password_hasher.hash(password)
+
 
+def hash_refresh_token(token: str) -> bytes:
+    """Return the SHA-256 digest used to store and look up a refresh token."""
+    return hashlib.sha256(token.encode()).digest()
 
-def create_access_token(user_id: str, settings: Settings) -> str:
+
+def create_access_token(
+    user_id: UUID,
+    settings: Settings,
+    now: datetime | None = None,
+) -> str:
     """
     Create a JWT access token.
 
     Args:
         user_id: The user's ID to encode in the token
         settings: Application settings
+        now: Issue time (defaults to the current UTC time)
 
     Returns:
         str: Encoded JWT access token
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.auth_access_token_expire_minutes
-    )
+    if now is None:
+        now = datetime.now(timezone.utc)
     to_encode = {
-        "sub": user_id,
-        "exp": expire,
+        "sub": str(user_id),
+        "exp": now + timedelta(minutes=settings.auth_access_token_expire_minutes),
         "type": "access",
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
     }
     return jwt.encode(
         to_encode,
@@ -66,29 +112,39 @@ def create_access_token(user_id: str, settings: Settings) -> str:
     )
 
 
-def create_refresh_token(user_id: str, db: Session, settings: Settings) -> str:
+def create_refresh_token(
+    user_id: UUID,
+    db: Session,
+    settings: Settings,
+    now: datetime | None = None,
+) -> str:
     """
-    Create a JWT refresh token and store it in the database.
+    Create a JWT refresh token and add it to the database session.
+
+    The token row is only staged; the caller commits it together with any
+    other writes for the request.
 
     Args:
         user_id: The user's ID
         db: Database session
         settings: Application settings
+        now: Issue time (defaults to the current UTC time)
 
     Returns:
         str: Encoded JWT refresh token
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.auth_refresh_token_expire_days
-    )
-    token_id = str(uuid4())
+    if now is None:
+        now = datetime.now(timezone.utc)
+    expire = now + timedelta(days=settings.auth_refresh_token_expire_days)
+    # Random 128-bit id used as both row id and jti (as 32 hex chars)
+    token_id = uuid4()
 
     to_encode = {
-        "sub": user_id,
+        "sub": str(user_id),
         "exp": expire,
         "type": "refresh",
-        "jti": token_id,
-        "iat": datetime.now(timezone.utc),
+        "jti": token_id.hex,
+        "iat": now,
     }
 
     encoded_token = jwt.encode(
@@ -100,33 +156,94 @@ def create_refresh_token(user_id: str, db: Session, settings: Settings) -> str:
     # Store refresh token in database
     db_token = RefreshToken(
         id=token_id,
-        token=encoded_token,
+        token_hash=hash_refresh_token(encoded_token),
         user_id=user_id,
         expires_at=expire,
     )
     db.add(db_token)
-    db.commit()
 
     return encoded_token
 
 
-def authenticate_user(db: Session, username: str, password: str) -> User | None:
+def purge_expired_refresh_tokens(
+    db: Session,
+    revoked_retention: timedelta,
+    batch_size: int = 10_000,
+) -> int:
+    """
+    Delete expired refresh tokens and revoked tokens past their retention.
+
+    Rows are deleted in batches, committing after each one, so a large
+    backlog never holds locks on much of the table at once.
+
+    Args:
+        db: Database session
+        revoked_retention: How long revoked tokens are kept after creation
+        batch_size: Maximum rows deleted per statement
+
+    Returns:
+        int: Number of refresh tokens deleted
+    """
+    now = datetime.now(timezone.utc)
+    purgeable_ids = (
+        select(RefreshToken.id)
+        .where(
+            or_(
+                RefreshToken.expires_at < now,
+                and_(
+                    RefreshToken.is_revoked == True,  # noqa: E712
+                    RefreshToken.created_at < now - revoked_retention,
+                ),
+            )
+        )
+        .limit(batch_size)
+    )
+
+    total = 0
+    while True:
+        deleted = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.id.in_(purgeable_ids))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+def authenticate_user(db: Session, username: str, password: str) -> Row | None:
     """
     Authenticate a user by username and password.
 
+    Only the columns needed for login are loaded, not the full User entity.
+
     Args:
         db: Database session
         username: User's username
         password: Plain text password
 
     Returns:
-        User if authentication successful, None otherwise
+        Row with id, hashed_password and is_active if authentication
+        successful, None otherwise
     """
-    user = db.query(User).filter(User.username == username).first()
+    user = (
+        db.query(User.id, User.hashed_password, User.is_active)
+        .filter(User.username == username)
+        .first()
+    )
     if not user:
+        verify_password(password, _DUMMY_HASH)
         return None
+
     if not verify_password(password, user.hashed_password):
         return None
+    if password_needs_rehash(user.hashed_password):
+        db.query(User).filter(User.id == user.id).update(
+            {"hashed_password": get_password_hash(password)},
+            synchronize_session=False,
+        )
+        db.commit()
     return user
 
 
@@ -134,7 +251,7 @@ def authenticate_user(db: Session, username: str, password: str) -> User | None:
 def register(
     user_data: UserCreate,
     db: DBSession,
-) -> User:
+) -> UserResponse:
     """
     Register a new user.
 
@@ -145,33 +262,34 @@ def register(
     Returns:
         UserResponse: Created user data
     """
-    # Check if email already exists
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
+    # Insert unless the email or username is taken; the unique indexes decide
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            hashed_password=get_password_hash(user_data.password),
         )
+        .on_conflict_do_nothing()
+        .returning(User)
+    )
+    user = db.scalars(stmt).one_or_none()
 
-    # Check if username already exists
-    existing_username = db.query(User).filter(User.username == user_data.username).first()
-    if existing_username:
+    if user is None:
+        email_taken = (
+            db.query(User.id).filter(User.email == user_data.email).first() is not None
+        )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken",
+            detail="Email already registered" if email_taken else "Username already taken",
         )
 
-    # Create new user
-    user = User(
-        email=user_data.email,
-        username=user_data.username,
-        hashed_password=get_password_hash(user_data.password),
-    )
-    db.add(user)
+    # RETURNING already loaded every column (including server defaults);
+    # build the response before commit expires the instance
+    response = UserResponse.model_validate(user)
     db.commit()
-    db.refresh(user)
 
-    return user
+    return response
 
 
 @router.post("/login", response_model=Token)
@@ -208,9 +326,13 @@ def login(
             detail="Inactive user",
         )
 
+    now = datetime.now(timezone.utc)
+    refresh_token = create_refresh_token(user.id, db, settings, now)
+    db.commit()
+
     return Token(
-        access_token=create_access_token(user.id, settings),
-        refresh_token=create_refresh_token(user.id, db, settings),
+        access_token=create_access_token(user.id, settings, now),
+        refresh_token=refresh_token,
     )
 
 
@@ -247,9 +369,13 @@ def login_json(
             detail="Inactive user",
         )
 
+    now = datetime.now(timezone.utc)
+    refresh_token = create_refresh_token(user.id, db, settings, now)
+    db.commit()
+
     return Token(
-        access_token=create_access_token(user.id, settings),
-        refresh_token=create_refresh_token(user.id, db, settings),
+        access_token=create_access_token(user.id, settings, now),
+        refresh_token=refresh_token,
     )
 
 
@@ -272,46 +398,65 @@ def refresh_tokens(
     Returns:
         Token: New access and refresh tokens
     """
-    token = refresh_request.refresh_token
-
-    # Find the refresh token in database
-    db_token = db.query(RefreshToken).filter(RefreshToken.token == token).first()
-
-    if not db_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid refresh token",
+    token_hash = hash_refresh_token(refresh_request.refresh_token)
+
+    # Revoke the old refresh token (token rotation) and get its owner in one
+    # statement. Only an unrevoked, unexpired token of an active user matches,
+    # so concurrent refreshes with the same token cannot both succeed.
+    user_id = db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.is_revoked == False,  # noqa: E712
+            RefreshToken.expires_at > func.now(),
+            RefreshToken.user_id == User.id,
+            User.is_active == True,  # noqa: E712
         )
-
-    if db_token.is_revoked:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Refresh token has been revoked",
+        .values(is_revoked=True)
+        .returning(RefreshToken.user_id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+
+    if user_id is None:
+        # Nothing was rotated; look the token up only to report why
+        db_token = (
+            db.query(RefreshToken)
+            .options(joinedload(RefreshToken.user))
+            .filter(RefreshToken.token_hash == token_hash)
+            .first()
         )
 
-    if db_token.is_expired:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Refresh token has expired",
-        )
+        if not db_token:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
 
-    # Get the user
-    user = db.query(User).filter(User.id == db_token.user_id).first()
+        if db_token.is_revoked:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has been revoked",
+            )
+
+        if not db_token.user or not db_token.user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or inactive",
+            )
 
-    if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or inactive",
+            detail="Refresh token has expired",
         )
 
-    # Revoke old refresh token (token rotation)
-    db_token.is_revoked = True
+    # Generate new tokens; the new refresh token commits with the revocation
+    now = datetime.now(timezone.utc)
+    refresh_token = create_refresh_token(user_id, db, settings, now)
     db.commit()
 
-    # Generate new tokens
     return Token(
-        access_token=create_access_token(user.id, settings),
-        refresh_token=create_refresh_token(user.id, db, settings),
+        access_token=create_access_token(user_id, settings, now),
+        refresh_token=refresh_token,
     )
 
 
@@ -332,19 +477,12 @@ def logout(
     Returns:
         MessageResponse: Logout success message
     """
-    # Find and revoke the refresh token
-    db_token = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.token == refresh_request.refresh_token,
-            RefreshToken.user_id == current_user.id,
-        )
-        .first()
-    )
-
-    if db_token:
-        db_token.is_revoked = True
-        db.commit()
+    # Revoke the refresh token with a single UPDATE (no-op if not found)
+    db.query(RefreshToken).filter(
+        RefreshToken.token_hash == hash_refresh_token(refresh_request.refresh_token),
+        RefreshToken.user_id == current_user.id,
+    ).update({"is_revoked": True}, synchronize_session=False)
+    db.commit()
 
     return MessageResponse(message="Successfully logged out")
 
@@ -368,25 +506,31 @@ def logout_all(
     db.query(RefreshToken).filter(
         RefreshToken.user_id == current_user.id,
         RefreshToken.is_revoked == False,  # noqa: E712
-    ).update({"is_revoked": True})
+    ).update({"is_revoked": True}, synchronize_session=False)
     db.commit()
 
     return MessageResponse(message="Successfully logged out from all devices")
 
 
-@router.get("/me", response_model=UserResponse)
+@router.get("/me", responses={200: {"model": UserResponse}})
 def get_current_user_info(
     current_user: CurrentUser,
-) -> User:
+) -> Response:
     """
     Get current authenticated user information.
 
+    The UserView is serialized directly; it only carries public columns,
+    so there is no UserResponse validation pass.
+
     Args:
         current_user: Current authenticated user
 
     Returns:
-        UserResponse: Current user data
+        Response: Current user data as UserResponse JSON
     """
-    return current_user
+    return Response(
+        orjson.dumps(current_user, option=orjson.OPT_UTC_Z),
+        media_type="application/json",
+    )
 
 
@@ -1,6 +1,6 @@
 """Configuration management for Auth Service using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cache, cached_property
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,26 +21,51 @@ class Settings(BaseSettings):
     auth_db_name: str = "auth_db"
     auth_db_host: str = "localhost"
     auth_db_port: int = 5432
+    # Executions of the same query before psycopg prepares it server-side
+    # (None disables prepared statements, e.g. behind PgBouncer)
+    auth_db_prepare_threshold: int | None = 5
+    # Run create_all at startup; off by default since Alembic owns the schema
+    auth_create_tables: bool = False
+    # Connections opened at startup so early requests skip connection setup
+    auth_db_pool_warm_connections: int = 2
 
     # JWT Configuration
     auth_jwt_secret_key: str = "your-super-secret-key-change-in-production"
     auth_jwt_algorithm: str = "HS256"
     auth_access_token_expire_minutes: int = 30
     auth_refresh_token_expire_days: int = 7
+    # Cache verified access tokens in-process for a few seconds (opt-in)
+    auth_jwt_cache_enabled: bool = False
+    auth_jwt_cache_ttl_seconds: int = 5
+    # Cache the current user's row in-process for this long (0 disables)
+    auth_user_cache_ttl_seconds: int = 0
+    # Background purge of expired/revoked refresh tokens (0 disables it)
+    auth_refresh_token_purge_interval_seconds: int = 300
+    auth_revoked_token_retention_days: int = 30
+
+    # Password hashing (argon2id); defaults follow the OWASP minimum
+    auth_argon2_time_cost: int = 2
+    auth_argon2_memory_cost_kib: int = 19456
+    auth_argon2_parallelism: int = 1
 
     # Application Configuration
     app_name: str = "FlowForward Auth Service"
     debug: bool = False
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Construct the database URL from individual components."""
         return (
-            f"postgresql://{self.auth_db_user}:{self.auth_db_password}"
+            f"postgresql+psycopg://{self.auth_db_user}:{self.auth_db_password}"
             f"@{self.auth_db_host}:{self.auth_db_port}/{self.auth_db_name}"
         )
 
-    @property
+    @cached_property
+    def auth_jwt_algorithms(self) -> tuple[str, ...]:
+        """Algorithms accepted when verifying JWTs."""
+        return (self.auth_jwt_algorithm,)
+
+    @cached_property
     def async_database_url(self) -> str:
         """Construct the async database URL for async SQLAlchemy."""
         return (
@@ -49,7 +74,7 @@ class Settings(BaseSettings):
         )
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
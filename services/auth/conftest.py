@@ -8,7 +8,7 @@ Each test function gets a fresh database transaction that is rolled back.
 import importlib.util
 import os
 import sys
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +24,10 @@ _test_env_defaults = {
     "AUTH_JWT_ALGORITHM": "HS256",
     "AUTH_ACCESS_TOKEN_EXPIRE_MINUTES": "30",
     "AUTH_REFRESH_TOKEN_EXPIRE_DAYS": "7",
+    # Cheapest argon2id parameters; tests check behaviour, not hash strength
+    "AUTH_ARGON2_TIME_COST": "1",
+    "AUTH_ARGON2_MEMORY_COST_KIB": "8",
+    "AUTH_ARGON2_PARALLELISM": "1",
     "DEBUG": "false",
 }
 
@@ -32,7 +36,9 @@ for key, value in _test_env_defaults.items():
     if key not in os.environ:
         os.environ[key] = value
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
@@ -43,8 +49,17 @@ _service_dir = Path(__file__).parent
 
 
 def _import_module(name: str, module_file: str):
-    """Import a module from the service directory by file path."""
+    """
+    Import a module from the service directory by file path.
+
+    Returns the already-loaded module if one with the same name was loaded
+    from the same file, so repeat imports don't re-run model definitions.
+    """
     module_path = _service_dir / module_file
+    existing = sys.modules.get(name)
+    if existing is not None and getattr(existing, "__file__", None) == str(module_path):
+        return existing
+
     spec = importlib.util.spec_from_file_location(name, module_path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[name] = module
@@ -80,7 +95,7 @@ class TestSettings(Settings):
     def database_url(self) -> str:
         """Construct the database URL for tests."""
         return (
-            f"postgresql://{self.auth_db_user}:{self.auth_db_password}"
+            f"postgresql+psycopg://{self.auth_db_user}:{self.auth_db_password}"
             f"@{self.auth_db_host}:{self.auth_db_port}/{self.auth_db_name}"
         )
 
@@ -90,8 +105,8 @@ def get_test_settings() -> TestSettings:
     return TestSettings()
 
 
-# Test schema name
-TEST_SCHEMA = "test_auth"
+# Test schema name, one per pytest-xdist worker so parallel runs don't collide
+TEST_SCHEMA = f"test_auth_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
 
 @pytest.fixture(scope="session")
@@ -107,52 +122,27 @@ def test_engine(test_settings: TestSettings):
     
     This fixture creates the test schema once per test session.
     """
+    # search_path includes public for the citext type
     engine = create_engine(
         test_settings.database_url,
-        pool_pre_ping=True,
         echo=False,
+        connect_args={"options": f"-c search_path={TEST_SCHEMA},public"},
     )
 
-    # Create the test schema if it doesn't exist
-    with engine.connect() as conn:
+    # Start from an empty test schema
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext SCHEMA public"))
         conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
         conn.execute(text(f"CREATE SCHEMA {TEST_SCHEMA}"))
-        conn.commit()
-
-    # Set the search path to use the test schema
-    @pytest.fixture(autouse=True)
-    def set_schema():
-        with engine.connect() as conn:
-            conn.execute(text(f"SET search_path TO {TEST_SCHEMA}"))
-            conn.commit()
-
-    # Create all tables in the test schema
-    with engine.connect() as conn:
-        conn.execute(text(f"SET search_path TO {TEST_SCHEMA}"))
-        conn.commit()
-
-    # Update engine to use test schema by default
-    engine = create_engine(
-        test_settings.database_url,
-        pool_pre_ping=True,
-        echo=False,
-        connect_args={"options": f"-c search_path={TEST_SCHEMA}"},
-    )
-
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+        # Schema is brand new; skip existence probes (they would also see public)
+        Base.metadata.create_all(bind=conn, checkfirst=False)
 
     yield engine
 
     # Cleanup: Drop the test schema after all tests
-    cleanup_engine = create_engine(
-        test_settings.database_url,
-        pool_pre_ping=True,
-    )
-    with cleanup_engine.connect() as conn:
+    with engine.begin() as conn:
         conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
-        conn.commit()
-    cleanup_engine.dispose()
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -207,6 +197,37 @@ def client(db_session: Session, test_settings: TestSettings) -> Generator[TestCl
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def aclient(
+    db_session: Session, test_settings: TestSettings
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Provide an async HTTP client calling the app in the test's event loop.
+
+    Requests go straight to the ASGI app without TestClient's thread
+    portal, which suits tests issuing many sequential requests. The
+    lifespan does not run. Overrides match the client fixture.
+    """
+    from config import get_settings
+
+    def override_get_db() -> Generator[Session, Any, None]:
+        yield db_session
+
+    def override_get_settings() -> Settings:
+        return test_settings
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_settings] = override_get_settings
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    ) as async_client:
+        yield async_client
+
+    app.dependency_overrides.clear()
+
+
 # --- Test Data Factories ---
 
 
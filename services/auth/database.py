@@ -3,7 +3,7 @@
 from collections.abc import Generator
 from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from config import get_settings
@@ -19,10 +19,14 @@ settings = get_settings()
 
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    # Recycle connections before server/LB idle timeouts instead of paying a
+    # SELECT 1 round-trip on every checkout
+    pool_pre_ping=False,
+    pool_recycle=1800,
     pool_size=10,
     max_overflow=20,
     echo=settings.debug,
+    connect_args={"prepare_threshold": settings.auth_db_prepare_threshold},
 )
 
 SessionLocal = sessionmaker(
@@ -32,6 +36,17 @@ SessionLocal = sessionmaker(
 )
 
 
+def warm_pool(connections: int) -> None:
+    """Open connections up front so they sit in the pool for early requests."""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for conn in opened:
+            conn.close()
+
+
 def get_db() -> Generator[Session, Any, None]:
     """
     Dependency that provides a database session.
@@ -46,7 +61,9 @@ def get_db() -> Generator[Session, Any, None]:
 
 
 def create_tables() -> None:
-    """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Create all database tables and the extensions they depend on."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext SCHEMA public"))
+        Base.metadata.create_all(bind=conn)
 
 
@@ -1,29 +1,149 @@
 """FastAPI dependencies for Auth Service."""
 
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
 from typing import Annotated
+from uuid import UUID
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
 from config import Settings, get_settings
 from database import get_db
 from models import User
-from schemas import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# jwt.decode options, built once rather than per request
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
+# Opt-in cache of verified access tokens -> (user_id, expiry timestamp), so a
+# bearer token seen again shortly after skips signature verification. Keyed
+# by a SHA-256 prefix so raw tokens are never held in memory. LRU-bounded.
+_TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: OrderedDict[bytes, tuple[UUID, float]] = OrderedDict()
+_token_cache_lock = Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Return the cache key for an access token."""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _get_cached_user_id(key: bytes) -> UUID | None:
+    """Return the user ID for a previously verified, unexpired access token."""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        user_id, expires = entry
+        if expires <= time.time():
+            del _token_cache[key]
+            return None
+        _token_cache.move_to_end(key)
+        return user_id
+
+
+def _cache_user_id(key: bytes, user_id: UUID, expires: float) -> None:
+    """Remember a verified access token until the given expiry timestamp."""
+    with _token_cache_lock:
+        _token_cache[key] = (user_id, expires)
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+
+@dataclass(slots=True, frozen=True)
+class UserView:
+    """Read-only snapshot of the user columns authenticated routes need."""
+
+    id: UUID
+    email: str
+    username: str
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+# Opt-in short-TTL cache of user_id -> (UserView, expiry timestamp) so repeat
+# requests from the same user skip the users SELECT. LRU-bounded.
+_USER_CACHE_MAXSIZE = 5000
+_user_cache: OrderedDict[UUID, tuple[UserView, float]] = OrderedDict()
+_user_cache_lock = Lock()
+
+
+def _load_user_view(db: Session, user_id: UUID) -> UserView | None:
+    """Load the UserView columns for a user ID, or None if not found."""
+    row = (
+        db.query(
+            User.id,
+            User.email,
+            User.username,
+            User.is_active,
+            User.is_superuser,
+            User.created_at,
+            User.updated_at,
+        )
+        .filter(User.id == user_id)
+        .first()
+    )
+    return None if row is None else UserView(*row)
+
+
+def _get_cached_user(user_id: UUID) -> UserView | None:
+    """Return a cached, unexpired UserView for a user ID."""
+    with _user_cache_lock:
+        entry = _user_cache.get(user_id)
+        if entry is None:
+            return None
+        user, expires = entry
+        if expires <= time.time():
+            del _user_cache[user_id]
+            return None
+        _user_cache.move_to_end(user_id)
+        return user
+
+
+def _cache_user(user: UserView, ttl_seconds: int) -> None:
+    """Remember a UserView for ttl_seconds."""
+    with _user_cache_lock:
+        _user_cache[user.id] = (user, time.time() + ttl_seconds)
+        _user_cache.move_to_end(user.id)
+        if len(_user_cache) > _USER_CACHE_MAXSIZE:
+            _user_cache.popitem(last=False)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """
+    Drop a user from the current-user cache.
+
+    Call after changing a user's status or profile so the change applies
+    before the cache TTL runs out.
+
+    Args:
+        user_id: ID of the user to drop
+    """
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
 
 def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[Session, Depends(get_db)],
     settings: Annotated[Settings, Depends(get_settings)],
-) -> User:
+) -> UserView:
     """
     Dependency to get the current authenticated user.
 
-    Validates the JWT token and retrieves the user from the database.
+    Validates the JWT token and loads the user from the database, or from
+    the short-lived user cache when AUTH_USER_CACHE_TTL_SECONDS is set.
 
     Args:
         token: JWT access token from Authorization header
@@ -31,7 +151,7 @@ def get_current_user(
         settings: Application settings
 
     Returns:
-        User: The authenticated user
+        UserView: The authenticated user
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -42,37 +162,49 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token,
-            settings.auth_jwt_secret_key,
-            algorithms=[settings.auth_jwt_algorithm],
-        )
-        user_id: str | None = payload.get("sub")
-        token_type: str | None = payload.get("type")
-
-        if user_id is None:
+    cache_key = None
+    user_id = None
+    if settings.auth_jwt_cache_enabled:
+        cache_key = _token_cache_key(token)
+        user_id = _get_cached_user_id(cache_key)
+
+    if user_id is None:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.auth_jwt_secret_key,
+                algorithms=settings.auth_jwt_algorithms,
+                options=_JWT_DECODE_OPTIONS,
+            )
+            user_id = UUID(payload["sub"])
+            exp = payload["exp"]
+            token_type: str | None = payload.get("type")
+
+            if token_type != "access":
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid token type",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+        except (jwt.InvalidTokenError, ValueError):
             raise credentials_exception
 
-        if token_type != "access":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
-                headers={"WWW-Authenticate": "Bearer"},
+        if cache_key is not None:
+            _cache_user_id(
+                cache_key,
+                user_id,
+                min(exp, time.time() + settings.auth_jwt_cache_ttl_seconds),
             )
 
-        token_payload = TokenPayload(
-            sub=user_id,
-            exp=payload.get("exp"),
-            type=token_type,
-        )
-    except JWTError:
-        raise credentials_exception
-
-    user = db.query(User).filter(User.id == token_payload.sub).first()
-
+    user = None
+    if settings.auth_user_cache_ttl_seconds > 0:
+        user = _get_cached_user(user_id)
     if user is None:
-        raise credentials_exception
+        user = _load_user_view(db, user_id)
+        if user is None:
+            raise credentials_exception
+        if settings.auth_user_cache_ttl_seconds > 0:
+            _cache_user(user, settings.auth_user_cache_ttl_seconds)
 
     if not user.is_active:
         raise HTTPException(
@@ -84,8 +216,8 @@ def get_current_user(
 
 
 def get_current_active_superuser(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[UserView, Depends(get_current_user)],
+) -> UserView:
     """
     Dependency to get the current active superuser.
 
@@ -93,7 +225,7 @@ def get_current_active_superuser(
         current_user: The current authenticated user
 
     Returns:
-        User: The authenticated superuser
+        UserView: The authenticated superuser
 
     Raises:
         HTTPException: If user is not a superuser
@@ -107,8 +239,8 @@ def get_current_active_superuser(
 
 
 # Type aliases for cleaner dependency injection
-CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentSuperuser = Annotated[User, Depends(get_current_active_superuser)]
+CurrentUser = Annotated[UserView, Depends(get_current_user)]
+CurrentSuperuser = Annotated[UserView, Depends(get_current_active_superuser)]
 DBSession = Annotated[Session, Depends(get_db)]
 AppSettings = Annotated[Settings, Depends(get_settings)]
 
@@ -1,19 +1,52 @@
 """FastAPI application entry point for Auth Service."""
 
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import OperationalError
 
+from auth import purge_expired_refresh_tokens
 from auth import router as auth_router
 from config import get_settings
-from database import create_tables
+from database import SessionLocal, create_tables, warm_pool
 from schemas import HealthResponse
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
 
+def purge_refresh_tokens(revoked_retention: timedelta) -> int:
+    """Run one refresh token purge in its own database session."""
+    with SessionLocal() as db:
+        return purge_expired_refresh_tokens(db, revoked_retention)
+
+
+async def purge_refresh_tokens_periodically(
+    interval_seconds: int,
+    revoked_retention: timedelta,
+) -> None:
+    """
+    Purge expired and old revoked refresh tokens every interval_seconds.
+
+    The blocking purge runs in a worker thread so the event loop stays free.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            deleted = await asyncio.to_thread(purge_refresh_tokens, revoked_retention)
+            if deleted:
+                logger.info("Purged %d refresh tokens", deleted)
+        except Exception:
+            logger.exception("Refresh token purge failed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -22,10 +55,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events.
     """
     # Startup
-    create_tables()
+    if settings.debug or settings.auth_create_tables:
+        # DDL round-trips run in a worker thread, off the event loop
+        await asyncio.to_thread(create_tables)
+
+    if settings.auth_db_pool_warm_connections > 0:
+        try:
+            await asyncio.to_thread(warm_pool, settings.auth_db_pool_warm_connections)
+        except OperationalError:
+            logger.warning("Could not pre-connect the database pool", exc_info=True)
+
+    # Resolve every route's dependencies and schemas now (cached on the app)
+    # rather than on the first request or /docs hit after a deploy
+    app.openapi()
+
+    purge_task = None
+    if settings.auth_refresh_token_purge_interval_seconds > 0:
+        purge_task = asyncio.create_task(
+            purge_refresh_tokens_periodically(
+                settings.auth_refresh_token_purge_interval_seconds,
+                timedelta(days=settings.auth_revoked_token_retention_days),
+            )
+        )
+
     yield
+
     # Shutdown
-    pass
+    if purge_task is not None:
+        purge_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await purge_task
 
 
 app = FastAPI(
@@ -43,36 +102,46 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Include routers
 app.include_router(auth_router)
 
 
-@app.get("/health", response_model=HealthResponse, tags=["Health"])
-def health_check() -> HealthResponse:
+# Constant payloads for probe-heavy endpoints, serialized once at import
+_HEALTH_BODY = orjson.dumps(
+    HealthResponse(
+        status="healthy",
+        service="auth-service",
+        version="0.1.0",
+    ).model_dump()
+)
+_ROOT_BODY = orjson.dumps(
+    {
+        "service": "FlowForward Auth Service",
+        "version": "0.1.0",
+        "docs": "/docs",
+    }
+)
+
+
+@app.get("/health", responses={200: {"model": HealthResponse}}, tags=["Health"])
+def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns service health status.
     """
-    return HealthResponse(
-        status="healthy",
-        service="auth-service",
-        version="0.1.0",
-    )
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
-def root() -> dict[str, str]:
+def root() -> Response:
     """Root endpoint."""
-    return {
-        "service": "FlowForward Auth Service",
-        "version": "0.1.0",
-        "docs": "/docs",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
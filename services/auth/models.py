@@ -1,10 +1,21 @@
 """SQLAlchemy models for Auth Service."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
-from uuid import uuid4
-
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    Text,
+    Uuid,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -18,19 +29,20 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[UUID] = mapped_column(
+        Uuid,
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid4,
     )
+    # CITEXT so lookups and uniqueness ignore case while still using the index
     email: Mapped[str] = mapped_column(
-        String(255),
+        CITEXT,
         unique=True,
         index=True,
         nullable=False,
     )
     username: Mapped[str] = mapped_column(
-        String(100),
+        CITEXT,
         unique=True,
         index=True,
         nullable=False,
@@ -78,19 +90,36 @@ class RefreshToken(Base):
 
     __tablename__ = "refresh_tokens"
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    __table_args__ = (
+        # Partial index for revoking a user's active tokens (logout/all)
+        Index(
+            "ix_refresh_tokens_user_active",
+            "user_id",
+            postgresql_where=text("is_revoked = false"),
+        ),
+        # Expiry and revoked-retention lookups for the background purge
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index(
+            "ix_refresh_tokens_revoked_created_at",
+            "created_at",
+            postgresql_where=text("is_revoked = true"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        Uuid,
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid4,
     )
-    token: Mapped[str] = mapped_column(
-        Text,
+    # SHA-256 digest of the encoded JWT; the token itself is never stored
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
         index=True,
         nullable=False,
     )
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -122,7 +151,8 @@ class RefreshToken(Base):
     @property
     def is_expired(self) -> bool:
         """Check if the token is expired."""
-        return datetime.now(self.expires_at.tzinfo) > self.expires_at
+        # expires_at is a timezone-aware column, so compare against UTC directly
+        return datetime.now(timezone.utc) > self.expires_at
 
     @property
     def is_valid(self) -> bool:
@@ -1,8 +1,12 @@
 """Pydantic schemas for Auth Service request/response validation."""
 
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shape check only (local@domain.tld); deliverability is not verified here
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
 
 
 # --- User Schemas ---
@@ -11,7 +15,7 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 class UserBase(BaseModel):
     """Base schema for User."""
 
-    email: EmailStr
+    email: str = Field(..., pattern=EMAIL_PATTERN, max_length=254)
     username: str = Field(..., min_length=3, max_length=100)
 
 
@@ -26,7 +30,7 @@ class UserResponse(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: str
+    id: UUID
     is_active: bool
     is_superuser: bool
     created_at: datetime
@@ -75,6 +75,69 @@ class TestFormLogin:
         assert response.status_code == 403
         assert response.json()["detail"] == "Inactive user"
 
+    def test_login_upgrades_legacy_bcrypt_hash(
+        self, client: TestClient, create_user, db_session
+    ):
+        """Test login with a legacy bcrypt hash succeeds and rehashes to argon2id."""
+        import bcrypt
+
+        from models import User
+
+        user = create_user()
+
+        db_user = db_session.query(User).filter(User.username == user["username"]).first()
+        db_user.hashed_password = bcrypt.hashpw(
+            user["password"].encode(), bcrypt.gensalt()
+        ).decode()
+        db_session.commit()
+
+        response = client.post(
+            "/api/v1/auth/login",
+            data={
+                "username": user["username"],
+                "password": user["password"],
+            },
+        )
+
+        assert response.status_code == 200
+        db_session.refresh(db_user)
+        assert db_user.hashed_password.startswith("$argon2id$")
+
+    def test_login_upgrades_legacy_bcrypt_hash_long_password(
+        self, client: TestClient, create_user, db_session
+    ):
+        """Test a legacy bcrypt hash of a password over 72 bytes still logs in."""
+        import bcrypt
+
+        from models import User
+
+        # 80 characters, 100 UTF-8 bytes
+        password = "pässwörd" * 10
+        user = create_user(password=password)
+
+        # Legacy hashes were made from the password truncated to 72 bytes
+        db_user = db_session.query(User).filter(User.username == user["username"]).first()
+        db_user.hashed_password = bcrypt.hashpw(
+            password.encode()[:72], bcrypt.gensalt()
+        ).decode()
+        db_session.commit()
+
+        login_data = {"username": user["username"], "password": password}
+        response = client.post("/api/v1/auth/login", data=login_data)
+
+        assert response.status_code == 200
+        db_session.refresh(db_user)
+        assert db_user.hashed_password.startswith("$argon2id$")
+
+        # The argon2id rehash covers the full password
+        response = client.post("/api/v1/auth/login", data=login_data)
+        assert response.status_code == 200
+        response = client.post(
+            "/api/v1/auth/login",
+            data={"username": user["username"], "password": password[:-1]},
+        )
+        assert response.status_code == 401
+
 
 class TestJsonLogin:
     """Test cases for POST /api/v1/auth/login/json endpoint."""
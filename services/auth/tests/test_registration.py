@@ -60,6 +60,24 @@ class TestUserRegistration:
         assert response.status_code == 400
         assert response.json()["detail"] == "Username already taken"
 
+    def test_register_user_duplicate_username_different_case(
+        self, client: TestClient, create_user
+    ):
+        """Test registration fails when username differs only by case."""
+        create_user(email="user1@example.com", username="caseuser")
+
+        response = client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "user2@example.com",
+                "username": "CaseUser",
+                "password": "anotherpassword123",
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Username already taken"
+
     def test_register_user_invalid_email(self, client: TestClient):
         """Test registration fails with invalid email format."""
         response = client.post(
@@ -51,13 +51,14 @@ class TestTokenRefresh:
         assert response.status_code == 401
         assert response.json()["detail"] == "Refresh token has been revoked"
 
-    def test_refresh_token_chain(self, client: TestClient, authenticated_user):
+    @pytest.mark.asyncio
+    async def test_refresh_token_chain(self, aclient, authenticated_user):
         """Test that new refresh tokens work correctly in a chain."""
         current_token = authenticated_user["refresh_token"]
 
         # Refresh multiple times
         for _ in range(3):
-            response = client.post(
+            response = await aclient.post(
                 "/api/v1/auth/refresh",
                 json={"refresh_token": current_token},
             )
@@ -89,6 +90,34 @@ class TestTokenRefresh:
         assert response.status_code == 401
         assert response.json()["detail"] == "User not found or inactive"
 
+    def test_refresh_token_expired(
+        self, client: TestClient, authenticated_user, db_session
+    ):
+        """Test refresh fails once the stored token has expired."""
+        from datetime import datetime, timedelta, timezone
+
+        from auth import hash_refresh_token
+        from models import RefreshToken
+
+        db_token = (
+            db_session.query(RefreshToken)
+            .filter(
+                RefreshToken.token_hash
+                == hash_refresh_token(authenticated_user["refresh_token"])
+            )
+            .first()
+        )
+        db_token.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db_session.commit()
+
+        response = client.post(
+            "/api/v1/auth/refresh",
+            json={"refresh_token": authenticated_user["refresh_token"]},
+        )
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Refresh token has expired"
+
     def test_refresh_token_missing_field(self, client: TestClient):
         """Test refresh fails with missing refresh_token field."""
         response = client.post(
@@ -98,3 +127,45 @@ class TestTokenRefresh:
 
         assert response.status_code == 422
 
+
+class TestPurgeExpiredTokens:
+    """Test cases for purging expired and revoked refresh tokens."""
+
+    def test_purge_expired_and_old_revoked_tokens(self, create_user, db_session):
+        """Test purge deletes expired and old revoked tokens only."""
+        from datetime import datetime, timedelta, timezone
+
+        from auth import purge_expired_refresh_tokens
+        from models import RefreshToken, User
+
+        user = create_user()
+        user_id = (
+            db_session.query(User.id).filter(User.username == user["username"]).scalar()
+        )
+        now = datetime.now(timezone.utc)
+
+        def add_token(token: bytes, expires_at, is_revoked=False, created_at=None):
+            db_session.add(
+                RefreshToken(
+                    token_hash=token.ljust(32, b"\0"),
+                    user_id=user_id,
+                    expires_at=expires_at,
+                    is_revoked=is_revoked,
+                    created_at=created_at or now,
+                )
+            )
+
+        add_token(b"expired", now - timedelta(minutes=1))
+        add_token(b"old-revoked", now + timedelta(days=1), True, now - timedelta(days=31))
+        add_token(b"recent-revoked", now + timedelta(days=1), True)
+        add_token(b"active", now + timedelta(days=1))
+        db_session.commit()
+
+        deleted = purge_expired_refresh_tokens(db_session, timedelta(days=30), batch_size=1)
+
+        assert deleted == 2
+        remaining = {
+            token_hash.rstrip(b"\0")
+            for (token_hash,) in db_session.query(RefreshToken.token_hash)
+        }
+        assert remaining == {b"recent-revoked", b"active"}
@@ -50,7 +50,7 @@ class TestUserInfo:
         """Test getting user info with expired token fails."""
         from datetime import datetime, timedelta, timezone
 
-        from jose import jwt
+        import jwt
 
         user = create_user()
 
@@ -111,6 +111,68 @@ class TestUserInfo:
         assert response.status_code == 403
         assert response.json()["detail"] == "Inactive user"
 
+    def test_get_current_user_inactive_after_token_reuse(
+        self,
+        client: TestClient,
+        authenticated_user,
+        auth_headers,
+        db_session,
+        test_settings,
+        monkeypatch,
+    ):
+        """Test a cached token is rejected after the user is deactivated."""
+        from models import User
+
+        monkeypatch.setattr(test_settings, "auth_jwt_cache_enabled", True)
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+
+        db_user = (
+            db_session.query(User)
+            .filter(User.username == authenticated_user["username"])
+            .first()
+        )
+        db_user.is_active = False
+        db_session.commit()
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Inactive user"
+
+    def test_get_current_user_cached_user_invalidated(
+        self,
+        client: TestClient,
+        authenticated_user,
+        auth_headers,
+        db_session,
+        test_settings,
+        monkeypatch,
+    ):
+        """Test invalidating a cached user applies deactivation before the TTL."""
+        from dependencies import invalidate_cached_user
+        from models import User
+
+        monkeypatch.setattr(test_settings, "auth_user_cache_ttl_seconds", 30)
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+
+        db_user = (
+            db_session.query(User)
+            .filter(User.username == authenticated_user["username"])
+            .first()
+        )
+        db_user.is_active = False
+        db_session.commit()
+        invalidate_cached_user(db_user.id)
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Inactive user"
+
     def test_get_current_user_deleted_user(
         self, client: TestClient, authenticated_user, auth_headers, db_session
     ):